@@ -16,6 +16,14 @@ class Config:
     
     # Arama ayarları
     DEFAULT_TOP_K = 5
+    SEARCH_MAX_WORKERS = 4
+    
+    # Koleksiyon ayarları
+    DEFAULT_COLLECTION = "default"
+    COLLECTIONS_DIR = "collections"
+    
+    # Arka plan yükleme ayarları
+    INGESTION_WORKERS = 2
     
     # Generation ayarları
     MAX_NEW_TOKENS_CHUNK = 100
@@ -0,0 +1,315 @@
+"""
+Türkçe PDF QA Sistemi - Arka Plan PDF Yükleme Modülü
+"""
+import os
+import time
+import signal
+import threading
+import multiprocessing
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Tuple
+from config import Config
+from utils import file_fingerprint
+
+# Worker process başına bir kez yüklenen modeller
+_worker_processor = None
+_worker_embed_model = None
+_worker_init_error: Optional[str] = None
+
+class WorkerInitError(RuntimeError):
+    """Worker process'te modeller yüklenemediğinde fırlatılır"""
+
+def _init_worker():
+    """Worker process'te tokenizer ve embedding modelini yükler"""
+    global _worker_processor, _worker_embed_model, _worker_init_error
+    
+    # Worker çıktıları (stdout/stderr, progress bar'lar, uyarılar) interaktif oturumu
+    # bozmasın; hatalar job üzerinden raporlanır
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.dup2(devnull, 2)
+    os.close(devnull)
+    
+    # Ctrl-C yalnızca ana process'e gitsin; worker'ları shutdown sonlandırır
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    
+    # Initializer'dan çıkan hata havuzu kalıcı olarak bozar ve sebebi kaybolur;
+    # hata saklanıp her dosya için job'a raporlanır
+    try:
+        from transformers import AutoTokenizer
+        from sentence_transformers import SentenceTransformer
+        from pdf_processor import PDFProcessor
+        
+        tokenizer = AutoTokenizer.from_pretrained(Config.LLM_MODEL_NAME)
+        _worker_processor = PDFProcessor(tokenizer)
+        _worker_embed_model = SentenceTransformer(Config.EMBEDDING_MODEL_NAME)
+    except Exception as e:
+        _worker_init_error = f"{type(e).__name__}: {str(e)}"
+
+def _process_pdf(pdf_file: str) -> Tuple[List[str], np.ndarray]:
+    """Tek PDF için metin çıkarma, chunk'lama ve embedding adımlarını çalıştırır"""
+    if _worker_init_error is not None:
+        raise WorkerInitError(f"Worker başlatılamadı: {_worker_init_error}")
+    
+    chunks = _worker_processor.process_pdf_file(pdf_file)
+    embeddings = _worker_embed_model.encode(
+        chunks,
+        convert_to_numpy=True,
+        show_progress_bar=False
+    )
+    return chunks, embeddings
+
+class _TrackingContext:
+    """Başlattığı worker process'lerin handle'larını tutan spawn context'i"""
+    
+    def __init__(self):
+        self._context = multiprocessing.get_context("spawn")
+        self.processes: List[multiprocessing.process.BaseProcess] = []
+    
+    def Process(self, *args, **kwargs):
+        process = self._context.Process(*args, **kwargs)
+        self.processes.append(process)
+        return process
+    
+    def __getattr__(self, name):
+        return getattr(self._context, name)
+    
+    def terminate_processes(self):
+        """Hâlâ çalışan worker process'leri sonlandırır"""
+        for process in self.processes:
+            if process.is_alive():
+                process.terminate()
+
+class IngestionJob:
+    """Tek bir arka plan yükleme işinin durumunu tutar"""
+    
+    def __init__(self, job_id: int, collection_name: str, pdf_files: List[str]):
+        self.job_id = job_id
+        self.collection_name = collection_name
+        self.pdf_files = pdf_files
+        self.status = "queued"
+        self.files_done = 0
+        self.files_skipped = 0
+        self.chunk_count = 0
+        self.errors: List[str] = []
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._done = threading.Event()
+    
+    @property
+    def elapsed(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.time()) - self.started_at
+    
+    @property
+    def throughput(self) -> float:
+        """Saniye başına işlenen chunk sayısı"""
+        return self.chunk_count / self.elapsed if self.elapsed > 0 else 0.0
+    
+    def wait(self, timeout: float = None) -> bool:
+        """İş bitene kadar bekler"""
+        return self._done.wait(timeout)
+    
+    def summary(self) -> str:
+        """İşin tek satırlık özetini döndürür"""
+        text = (f"{self.status} | {self.collection_name} | "
+                f"{self.files_done}/{len(self.pdf_files)} dosya | "
+                f"{self.files_skipped} atlandı | "
+                f"{self.chunk_count} chunk | {self.throughput:.1f} chunk/s | "
+                f"{self.elapsed:.1f}s")
+        if self.errors:
+            text += f" | {len(self.errors)} hata: " + "; ".join(self.errors)
+        return text
+
+class IngestionManager:
+    """PDF'leri worker process'lerde işleyip index'leri QA sistemine aktaran iş kuyruğu"""
+    
+    def __init__(self, qa_system, max_workers: int = None):
+        if max_workers is None:
+            max_workers = Config.INGESTION_WORKERS
+        
+        self.qa_system = qa_system
+        self._max_workers = max_workers
+        self._context: Optional[_TrackingContext] = None
+        self._executor = self._create_executor()
+        self._jobs: Dict[int, IngestionJob] = {}
+        self._lock = threading.Lock()
+        self._next_id = 1
+        self._backend_restarts = 0
+        self._backend_error: Optional[str] = None
+    
+    def _create_executor(self) -> ProcessPoolExecutor:
+        """Worker process havuzunu oluşturur"""
+        # CUDA ve tokenizer thread'leri fork ile güvenli değil; worker'lar çıkışta
+        # sonlandırılabilsin diye handle'ları context üzerinden tutulur
+        self._context = _TrackingContext()
+        return ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=self._context,
+            initializer=_init_worker
+        )
+    
+    def _restart_executor(self, broken: ProcessPoolExecutor, error: Exception) -> ProcessPoolExecutor:
+        """Çöken veya başlatılamayan worker havuzunu yenisiyle değiştirir"""
+        with self._lock:
+            # Aynı çökmeyi gören diğer işler havuzu ikinci kez yeniden başlatmasın
+            if self._executor is broken:
+                broken.shutdown(wait=False, cancel_futures=True)
+                self._context.terminate_processes()
+                self._executor = self._create_executor()
+                self._backend_restarts += 1
+                self._backend_error = str(error) or type(error).__name__
+                print(f"\n⚠️  Yükleme worker'ları kullanılamaz durumda, havuz yeniden başlatıldı: "
+                      f"{self._backend_error}")
+            return self._executor
+    
+    def _submit_files(self, job: IngestionJob, indices: List[int]):
+        """Dosyaları worker havuzuna gönderir; havuz çökmüşse önce yeniden başlatır"""
+        executor = self._executor
+        try:
+            futures = {executor.submit(_process_pdf, job.pdf_files[i]): i for i in indices}
+        except BrokenProcessPool as e:
+            executor = self._restart_executor(executor, e)
+            futures = {executor.submit(_process_pdf, job.pdf_files[i]): i for i in indices}
+        return executor, futures
+    
+    def submit(self, pdf_files: List[str], collection_name: str = None) -> IngestionJob:
+        """PDF'leri arka planda yüklenmek üzere kuyruğa ekler"""
+        if collection_name is None:
+            collection_name = Config.DEFAULT_COLLECTION
+        
+        with self._lock:
+            # Aynı dosya bir işte iki kez işlenmesin
+            paths = list(dict.fromkeys(os.path.abspath(pdf_file) for pdf_file in pdf_files))
+            job = IngestionJob(self._next_id, collection_name, paths)
+            self._jobs[job.job_id] = job
+            self._next_id += 1
+        
+        thread = threading.Thread(target=self._run_job, args=(job,), daemon=True)
+        thread.start()
+        print(f"📥 Yükleme işi #{job.job_id} başlatıldı ({len(job.pdf_files)} PDF → {collection_name})")
+        return job
+    
+    def _run_job(self, job: IngestionJob):
+        """İşin dosyalarını worker'lara dağıtır ve sonuçları koleksiyona ekler"""
+        job.status = "running"
+        job.started_at = time.time()
+        results = {}
+        
+        try:
+            fingerprints = {}
+            for pdf_file in job.pdf_files:
+                try:
+                    fingerprints[pdf_file] = file_fingerprint(pdf_file)
+                except OSError as e:
+                    job.errors.append(f"{os.path.basename(pdf_file)}: {str(e)}")
+                    job.files_done += 1
+            
+            # Koleksiyonda aynı içerikle bulunan dosyalar işlenmez; kesin kontrol
+            # update_collection içinde writer lock altında tekrarlanır
+            known = self.qa_system.get_collection_sources(job.collection_name)
+            pending = [i for i, pdf_file in enumerate(job.pdf_files)
+                       if pdf_file in fingerprints and known.get(pdf_file) != fingerprints[pdf_file]]
+            job.files_skipped = len(fingerprints) - len(pending)
+            job.files_done += job.files_skipped
+            if not pending:
+                if not fingerprints:
+                    raise ValueError("Hiçbir PDF dosyası okunamadı!")
+                job.status = "completed"
+                print(f"\nℹ️  Yükleme işi #{job.job_id}: tüm dosyalar {job.collection_name} "
+                      f"koleksiyonunda güncel")
+                return
+            
+            executor, futures = self._submit_files(job, pending)
+            broken = None
+            
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    chunks, embeddings = future.result()
+                    results[i] = (chunks, embeddings)
+                    job.chunk_count += len(chunks)
+                except BrokenProcessPool as e:
+                    broken = e
+                    job.errors.append(f"{os.path.basename(job.pdf_files[i])}: worker process çöktü")
+                except WorkerInitError as e:
+                    broken = e
+                    job.errors.append(f"{os.path.basename(job.pdf_files[i])}: {str(e)}")
+                except Exception as e:
+                    job.errors.append(f"{os.path.basename(job.pdf_files[i])}: {str(e)}")
+                job.files_done += 1
+            
+            # Sonraki işler çalışabilsin diye çöken veya başlatılamayan havuz yenilenir
+            if broken is not None:
+                self._restart_executor(executor, broken)
+            
+            if not results:
+                raise ValueError("Hiçbir PDF dosyasından metin çıkarılamadı!")
+            
+            # Chunk sırası dosya sırasıyla aynı kalsın
+            files = [
+                (job.pdf_files[i], fingerprints[job.pdf_files[i]], *results[i])
+                for i in sorted(results)
+            ]
+            collection, applied = self.qa_system.update_collection(job.collection_name, files)
+            job.files_skipped += len(files) - len(applied)
+            job.status = "completed"
+            if job.collection_name in self.qa_system.list_collections():
+                print(f"\n✅ Yükleme işi #{job.job_id} tamamlandı "
+                      f"({job.collection_name}: {len(collection.chunks)} chunk)")
+            else:
+                print(f"\n✅ Yükleme işi #{job.job_id} tamamlandı; {job.collection_name} bellekte "
+                      f"olmadığı için yalnızca diskte güncellendi ({len(collection.chunks)} chunk)")
+        
+        except Exception as e:
+            job.status = "failed"
+            job.errors.append(str(e))
+            print(f"\n❌ Yükleme işi #{job.job_id} başarısız: {str(e)}")
+        
+        finally:
+            job.finished_at = time.time()
+            job._done.set()
+    
+    def get_jobs(self) -> List[IngestionJob]:
+        """Tüm işleri oluşturulma sırasıyla döndürür"""
+        with self._lock:
+            return [self._jobs[job_id] for job_id in sorted(self._jobs)]
+    
+    def has_active_jobs(self) -> bool:
+        """Devam eden yükleme işi olup olmadığını döndürür"""
+        return any(job.status in ("queued", "running") for job in self.get_jobs())
+    
+    def get_stats(self) -> dict:
+        """Yükleme işlerinin istatistiklerini döndürür"""
+        jobs = self.get_jobs()
+        stats = {
+            "ingestion_jobs": len(jobs),
+            "ingestion_active": sum(job.status in ("queued", "running") for job in jobs),
+            "ingestion_failed": sum(job.status == "failed" for job in jobs),
+        }
+        if self._backend_restarts:
+            stats["ingestion_backend"] = (f"{self._backend_restarts} kez yeniden başlatıldı "
+                                          f"(son hata: {self._backend_error})")
+        else:
+            stats["ingestion_backend"] = "ok"
+        for job in jobs:
+            stats[f"job_{job.job_id}"] = job.summary()
+        return stats
+    
+    def shutdown(self):
+        """Bekleyen işleri iptal eder ve çalışan worker process'leri sonlandırır"""
+        active = self.has_active_jobs()
+        with self._lock:
+            executor = self._executor
+            context = self._context
+        
+        # cancel_futures çalışmaya başlamış dosyaları durdurmaz; çıkışın bunları
+        # beklememesi için worker'lar doğrudan sonlandırılır
+        executor.shutdown(wait=False, cancel_futures=True)
+        context.terminate_processes()
+        
+        if active:
+            print("⏹️  Devam eden yükleme işleri durduruldu; tamamlanmayan dosyalar eklenmedi") 
\ No newline at end of file
@@ -6,6 +6,7 @@ Kullanım:
     python main.py -f dosya.pdf             # Tek dosya
     python main.py -f dosya1.pdf dosya2.pdf # Birden fazla dosya
     python main.py -d /path/to/folder       # Klasördeki tüm PDF'ler
+    python main.py -f doc.pdf -c sozlesmeler # İsimli koleksiyona yükle
 """
 import argparse
 import sys
@@ -21,7 +22,8 @@ from utils import (
     validate_pdf_file,
     find_pdf_files
 )
-from pdf_qa import TurkishPDFQA
+from pdf_qa import TurkishPDFQA, DocumentCollection
+from ingestion import IngestionManager
 
 def parse_arguments():
     """Command line argümanlarını parse eder"""
@@ -35,6 +37,7 @@ Kullanım örnekleri:
   python main.py -f doc1.pdf doc2.pdf      # Birden fazla dosya  
   python main.py -d ./documents            # Klasördeki tüm PDF'ler
   python main.py -f doc.pdf -q "Soru?"     # Tek soru ile başlat
+  python main.py -f doc.pdf -c kilavuzlar  # İsimli koleksiyona yükle
         """
     )
     
@@ -61,6 +64,18 @@ Kullanım örnekleri:
         help=f'Arama için kullanılacak chunk sayısı (varsayılan: {Config.DEFAULT_TOP_K})'
     )
     
+    parser.add_argument(
+        '-c', '--collection',
+        help=f'PDF\'lerin ekleneceği kayıtlı koleksiyon adı (verilmezse yalnızca bu çalıştırmadaki '
+             f'PDF\'ler geçici "{Config.DEFAULT_COLLECTION}" koleksiyonunda indexlenir)'
+    )
+    
+    parser.add_argument(
+        '--search',
+        nargs='+',
+        help='Aramada kullanılacak koleksiyonlar (varsayılan: tümü)'
+    )
+    
     parser.add_argument(
         '--interactive',
         action='store_true',
@@ -97,7 +112,74 @@ def get_pdf_files_from_args(args) -> List[str]:
     
     return pdf_files
 
-def run_qa_session(qa_system: TurkishPDFQA, initial_question: Optional[str] = None, top_k: int = None):
+def find_unknown_collections(names: List[str], qa_system: Optional[TurkishPDFQA] = None,
+                             extra: Optional[List[str]] = None) -> List[str]:
+    """Bellekte, diskte veya ek isimler arasında bulunmayan koleksiyonları döndürür"""
+    known = set(DocumentCollection.list_stored()) | set(extra or [])
+    if qa_system is not None:
+        known |= set(qa_system.list_collections())
+    return [name for name in names if name not in known]
+
+def handle_collection_command(qa_system: TurkishPDFQA, ingestion: IngestionManager, command: str,
+                              search_collections: Optional[List[str]]) -> Optional[List[str]]:
+    """Koleksiyon komutlarını işler ve güncel arama koleksiyonlarını döndürür"""
+    parts = command.split()
+    name = parts[0].lower()
+    
+    if name == 'collections':
+        print("\n📁 Koleksiyonlar:")
+        loaded = qa_system.get_stats().get("collections", {})
+        for collection_name in sorted(set(loaded) | set(qa_system.list_stored_collections())):
+            if collection_name in loaded:
+                print(f"   • {collection_name} (bellekte, {loaded[collection_name]} chunk)")
+            else:
+                print(f"   • {collection_name} (diskte)")
+        selected = ', '.join(search_collections) if search_collections else 'tümü'
+        print(f"   🔍 Aramada kullanılanlar: {selected}")
+        
+    elif name == 'use':
+        if len(parts) < 2:
+            print("❌ Kullanım: use <koleksiyon...> | use all")
+        elif parts[1].lower() == 'all':
+            search_collections = None
+            print("✅ Tüm koleksiyonlarda arama yapılacak")
+        else:
+            missing = find_unknown_collections(parts[1:], qa_system)
+            if missing:
+                print(f"❌ Koleksiyon bulunamadı: {', '.join(missing)}")
+            else:
+                search_collections = list(dict.fromkeys(parts[1:]))
+                print(f"✅ Arama koleksiyonları: {', '.join(search_collections)}")
+        
+    elif name == 'load':
+        if len(parts) < 2:
+            print("❌ Kullanım: load <koleksiyon> [dosya.pdf...]")
+        elif len(parts) == 2:
+            qa_system.mount_collection(parts[1])
+        else:
+            pdf_files = [path for path in parts[2:] if validate_pdf_file(path)]
+            if pdf_files:
+                ingestion.submit(pdf_files, parts[1])
+        
+    elif name == 'unload':
+        if len(parts) < 2:
+            print("❌ Kullanım: unload <koleksiyon>")
+        elif qa_system.unload_collection(parts[1]) and search_collections:
+            search_collections = [c for c in search_collections if c != parts[1]] or None
+        
+    elif name == 'delete':
+        if len(parts) < 2:
+            print("❌ Kullanım: delete <koleksiyon>")
+        elif not qa_system.delete_collection(parts[1]):
+            print(f"⚠️  Koleksiyon bulunamadı: {parts[1]}")
+        elif search_collections:
+            search_collections = [c for c in search_collections if c != parts[1]] or None
+    
+    return search_collections
+
+def run_qa_session(qa_system: TurkishPDFQA, ingestion: IngestionManager,
+                   initial_question: Optional[str] = None, top_k: int = None,
+                   search_collections: Optional[List[str]] = None):
     """Soru-cevap oturumunu çalıştırır"""
     print("\n" + Config.SEPARATOR_LINE)
     print("🤖 SORU-CEVAP OTURUMU")
@@ -105,14 +187,16 @@ def run_qa_session(qa_system: TurkishPDFQA, initial_question: Optional[str] = No
     print("💡 İpuçları:")
     print("   • Açık ve spesifik sorular sorun")
     print("   • 'çık', 'exit' veya 'quit' ile çıkabilirsiniz")
-    print("   • 'stats' ile sistem istatistiklerini görebilirsiniz")
+    print("   • 'stats' ile sistem ve yükleme işi istatistiklerini görebilirsiniz")
+    print("   • PDF'ler arka planda yüklenirken mevcut index ile soru sorabilirsiniz")
+    print("   • 'collections', 'use', 'load', 'unload' ve 'delete' ile koleksiyonları yönetebilirsiniz")
     print(Config.SEPARATOR_LINE)
     
     # İlk soru varsa sor
     if initial_question:
         print(f"📝 İlk Soru: {initial_question}")
         try:
-            answer = qa_system.ask_question(initial_question, top_k)
+            answer = qa_system.ask_question(initial_question, top_k, search_collections)
             print(f"\n🤖 Cevap: {answer}")
             print(Config.QUESTION_SEPARATOR)
         except Exception as e:
@@ -132,13 +216,24 @@ def run_qa_session(qa_system: TurkishPDFQA, initial_question: Optional[str] = No
                 
             if question.lower() == 'stats':
                 stats = qa_system.get_stats()
+                stats.update(ingestion.get_stats())
                 print("\n📊 Sistem İstatistikleri:")
                 for key, value in stats.items():
                     print(f"   {key}: {value}")
                 continue
             
+            if question.split()[0].lower() in ['collections', 'use', 'load', 'unload', 'delete']:
+                search_collections = handle_collection_command(qa_system, ingestion, question,
+                                                               search_collections)
+                continue
+            
+            if not qa_system.can_search(search_collections) and ingestion.has_active_jobs():
+                print("⏳ PDF'ler hâlâ yükleniyor, henüz sorgulanabilecek bir index yok.")
+                print("   İlerlemeyi 'stats' ile görebilirsiniz.")
+                continue
+            
             print("🔍 Cevap aranıyor...")
-            answer = qa_system.ask_question(question, top_k)
+            answer = qa_system.ask_question(question, top_k, search_collections)
             print(f"\n🤖 Cevap: {answer}")
             print(Config.QUESTION_SEPARATOR)
             
@@ -158,6 +253,14 @@ def main():
         # Argümanları parse et
         args = parse_arguments()
         
+        # Arama koleksiyonlarını modeller yüklenmeden önce kontrol et
+        if args.search:
+            target = args.collection or Config.DEFAULT_COLLECTION
+            missing = find_unknown_collections(args.search, extra=[target])
+            if missing:
+                print(f"❌ Koleksiyon bulunamadı: {', '.join(missing)}")
+                sys.exit(1)
+        
         # PDF dosyalarını al
         if args.interactive or (not args.files and not args.directory):
             # İnteraktif mod
@@ -180,12 +283,32 @@ def main():
         print(Config.SEPARATOR_LINE)
         
         qa_system = TurkishPDFQA()
+        ingestion = IngestionManager(qa_system)
         
-        # PDF'leri yükle
-        qa_system.load_pdfs(pdf_files)
-        
-        # Soru-cevap oturumunu başlat
-        run_qa_session(qa_system, args.question, args.top_k)
+        try:
+            if args.collection is None:
+                # -c verilmediğinde yalnızca bu çalıştırmada verilen PDF'ler indexlenir
+                collection_name = Config.DEFAULT_COLLECTION
+                qa_system.delete_collection(collection_name)
+            else:
+                # Kayıtlı koleksiyon varsa yeni dosyalar ona eklenir
+                collection_name = args.collection
+                if collection_name in qa_system.list_stored_collections():
+                    qa_system.mount_collection(collection_name)
+            
+            # PDF'leri arka planda yükle
+            job = ingestion.submit(pdf_files, collection_name)
+            
+            # İlk soru için index'in hazır olmasını bekle
+            if args.question:
+                print("⏳ İlk soru için PDF yüklemesi bekleniyor...")
+                job.wait()
+            
+            # Soru-cevap oturumunu başlat
+            search_collections = list(dict.fromkeys(args.search)) if args.search else None
+            run_qa_session(qa_system, ingestion, args.question, args.top_k, search_collections)
+        finally:
+            ingestion.shutdown()
         
     except KeyboardInterrupt:
         print("\n\n👋 Program sonlandırıldı!")
@@ -25,32 +25,6 @@ class PDFProcessor:
             # Dosya objesi verilmiş
             return self._extract_text_from_file(pdf_source)
     
-    def extract_text_from_multiple_pdfs(self, pdf_sources: List[Union[str, BinaryIO]]) -> str:
-        """Birden fazla PDF dosyasından metin çıkarır ve birleştirir"""
-        print(f"📚 {len(pdf_sources)} PDF dosyası işleniyor...")
-        all_texts = []
-        
-        for i, pdf_source in enumerate(pdf_sources, 1):
-            print(f"📄 PDF {i}/{len(pdf_sources)} işleniyor...")
-            try:
-                text = self.extract_text_from_pdf(pdf_source)
-                if text.strip():
-                    all_texts.append(text)
-                    print(f"✅ PDF {i} başarıyla işlendi ({len(text)} karakter)")
-                else:
-                    print(f"⚠️  PDF {i} boş veya okunamadı")
-            except Exception as e:
-                print(f"❌ PDF {i} işlenirken hata: {str(e)}")
-                continue
-        
-        if not all_texts:
-            raise ValueError("Hiçbir PDF dosyasından metin çıkarılamadı!")
-        
-        # Tüm metinleri birleştir
-        combined_text = "\n\n--- YENİ DÖKÜMAN ---\n\n".join(all_texts)
-        print(f"✅ Toplam {len(all_texts)} PDF birleştirildi ({len(combined_text)} karakter)")
-        return combined_text
-    
     def _extract_text_from_file(self, file_obj: BinaryIO) -> str:
         """Dosya objesinden metin çıkarır"""
         try:
@@ -93,23 +67,13 @@ class PDFProcessor:
         except Exception as e:
             raise Exception(f"Metin bölme hatası: {str(e)}")
     
-    def process_pdf_files(self, pdf_files: List[str]) -> List[str]:
-        """PDF dosyalarını işleyip chunk'lara böler"""
-        print("🚀 PDF işleme başlıyor...")
-        
-        if len(pdf_files) == 1:
-            # Tek dosya
-            combined_text = self.extract_text_from_pdf(pdf_files[0])
-        else:
-            # Birden fazla dosya
-            combined_text = self.extract_text_from_multiple_pdfs(pdf_files)
-        
-        if not combined_text.strip():
-            raise ValueError("PDF'lerden hiç metin çıkarılamadı!")
-        
-        # Chunk'lara böl
-        chunks = self.split_text_into_chunks(combined_text)
+    def process_pdf_file(self, pdf_file: str) -> List[str]:
+        """Tek PDF dosyasını işleyip chunk'lara böler"""
+        text = self.extract_text_from_pdf(pdf_file)
+        if not text.strip():
+            raise ValueError("PDF'ten hiç metin çıkarılamadı!")
         
+        chunks = self.split_text_into_chunks(text)
         if not chunks:
             raise ValueError("Metin chunk'lara bölünemedi!")
         
@@ -1,14 +1,145 @@
 """
 Türkçe PDF QA Sistemi - Ana QA Sınıfı
 """
+import os
+import re
+import json
+import shutil
 import torch
 import faiss
 import numpy as np
-from typing import List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from transformers import AutoTokenizer, AutoModelForCausalLM
 from sentence_transformers import SentenceTransformer
 from config import Config
-from pdf_processor import PDFProcessor
+
+class DocumentCollection:
+    """Tek bir doküman koleksiyonunun chunk'larını ve FAISS index'ini tutar"""
+    
+    def __init__(self, name: str, chunks: List[str], index: faiss.Index, 
+                 sources: Optional[Dict[str, str]] = None,
+                 chunk_sources: Optional[List[str]] = None):
+        self.name = name
+        self.chunks = chunks
+        self.index = index
+        # Dosya yolu -> içerik parmak izi ve her chunk'ın geldiği dosya
+        self.sources = sources or {}
+        self.chunk_sources = chunk_sources or []
+    
+    @classmethod
+    def empty(cls, name: str, embedding_dim: int) -> "DocumentCollection":
+        """Boş bir koleksiyon oluşturur"""
+        return cls(name, [], faiss.IndexFlatL2(embedding_dim))
+    
+    @property
+    def embedding_dim(self) -> int:
+        return self.index.d
+    
+    def updated(self, files: List[Tuple[str, str, List[str], np.ndarray]]
+                ) -> Tuple["DocumentCollection", List[str]]:
+        """Dosyaların (yol, parmak izi, chunk'lar, embedding'ler) eklendiği bir kopya döndürür
+        
+        Aynı parmak iziyle zaten bulunan dosyalar atlanır; içeriği değişen dosyaların
+        eski chunk'ları çıkarılıp yenileri eklenir. Mevcut index değişmez. Uygulanan
+        dosyaların yolları da döndürülür.
+        """
+        new_files = {}
+        for path, fingerprint, chunks, embeddings in files:
+            if self.sources.get(path) != fingerprint and path not in new_files:
+                new_files[path] = (fingerprint, chunks, embeddings)
+        
+        if not new_files:
+            return self, []
+        
+        index = faiss.clone_index(self.index)
+        chunks = list(self.chunks)
+        chunk_sources = list(self.chunk_sources)
+        
+        # İçeriği değişen dosyaların eski chunk'ları çıkarılır
+        replaced = [i for i, path in enumerate(chunk_sources) if path in new_files]
+        if replaced:
+            index.remove_ids(np.array(replaced, dtype=np.int64))
+            chunks = [c for c, path in zip(chunks, chunk_sources) if path not in new_files]
+            chunk_sources = [path for path in chunk_sources if path not in new_files]
+        
+        sources = dict(self.sources)
+        for path, (fingerprint, file_chunks, embeddings) in new_files.items():
+            index.add(embeddings)
+            chunks.extend(file_chunks)
+            chunk_sources.extend([path] * len(file_chunks))
+            sources[path] = fingerprint
+        
+        collection = DocumentCollection(self.name, chunks, index, sources, chunk_sources)
+        return collection, list(new_files)
+    
+    @staticmethod
+    def storage_path(name: str) -> str:
+        """Koleksiyonun diskteki klasörünü döndürür"""
+        if not re.fullmatch(r'[\w\-]+', name):
+            raise ValueError(f"Geçersiz koleksiyon adı: {name}")
+        return os.path.join(Config.COLLECTIONS_DIR, name)
+    
+    @classmethod
+    def exists(cls, name: str) -> bool:
+        """Koleksiyonun diskte kayıtlı olup olmadığını kontrol eder"""
+        return os.path.isfile(os.path.join(cls.storage_path(name), "index.faiss"))
+    
+    @classmethod
+    def list_stored(cls) -> List[str]:
+        """Diskte kayıtlı koleksiyon isimlerini döndürür"""
+        if not os.path.isdir(Config.COLLECTIONS_DIR):
+            return []
+        return sorted(name for name in os.listdir(Config.COLLECTIONS_DIR)
+                      if re.fullmatch(r'[\w\-]+', name) and cls.exists(name))
+    
+    def save(self):
+        """Index'i ve chunk'ları diske yazar"""
+        path = self.storage_path(self.name)
+        os.makedirs(path, exist_ok=True)
+        index_path = os.path.join(path, "index.faiss")
+        chunks_path = os.path.join(path, "chunks.json")
+        
+        # Yarım kalmış yazma mevcut dosyaları bozmasın
+        faiss.write_index(self.index, index_path + ".tmp")
+        with open(chunks_path + ".tmp", 'w', encoding='utf-8') as f:
+            json.dump({
+                "sources": self.sources,
+                "chunks": self.chunks,
+                "chunk_sources": self.chunk_sources
+            }, f, ensure_ascii=False)
+        os.replace(index_path + ".tmp", index_path)
+        os.replace(chunks_path + ".tmp", chunks_path)
+    
+    @classmethod
+    def load_sources(cls, name: str) -> Dict[str, str]:
+        """Index'i okumadan koleksiyonun kaynak dosyalarını ve parmak izlerini döndürür"""
+        if not cls.exists(name):
+            return {}
+        with open(os.path.join(cls.storage_path(name), "chunks.json"), encoding='utf-8') as f:
+            return json.load(f)["sources"]
+    
+    @classmethod
+    def load(cls, name: str) -> "DocumentCollection":
+        """Koleksiyonu diskten okur"""
+        path = cls.storage_path(name)
+        index = faiss.read_index(os.path.join(path, "index.faiss"))
+        with open(os.path.join(path, "chunks.json"), encoding='utf-8') as f:
+            data = json.load(f)
+        
+        if not index.ntotal == len(data["chunks"]) == len(data["chunk_sources"]):
+            raise ValueError(f"Koleksiyon dosyaları tutarsız: {name}")
+        return cls(name, data["chunks"], index, data["sources"], data["chunk_sources"])
+    
+    def search(self, query_embedding: np.ndarray, top_k: int) -> List[Tuple[float, str]]:
+        """Koleksiyonda en yakın chunk'ları (mesafe, chunk) olarak döndürür"""
+        k = min(top_k, self.index.ntotal)
+        if k == 0:
+            return []
+        
+        D, I = self.index.search(query_embedding, k)
+        return [(float(d), self.chunks[i]) for d, i in zip(D[0], I[0]) if i >= 0]
 
 class TurkishPDFQA:
     """Türkçe PDF Soru-Cevap Ana Sınıfı"""
@@ -40,50 +171,124 @@ class TurkishPDFQA:
         self.embed_model = SentenceTransformer(Config.EMBEDDING_MODEL_NAME)
         print("✅ Embedding modeli yüklendi")
         
-        # PDF processor
-        self.pdf_processor = PDFProcessor(self.tokenizer)
+        # Koleksiyonlar (isim -> DocumentCollection)
+        # _collections_lock yalnızca sözlük erişimini korur; sorgular tutarlı bir kopya görür.
+        # Aynı koleksiyonu değiştiren işlemler koleksiyon başına writer lock ile sıralanır.
+        self.collections: Dict[str, DocumentCollection] = {}
+        self._collections_lock = threading.Lock()
+        self._writer_locks: Dict[str, threading.Lock] = {}
         
-        # Veri saklama
-        self.pdf_chunks = []
-        self.embeddings = None
-        self.index = None
+        # Koleksiyonlar arası paralel arama için kalıcı thread havuzu
+        self._search_executor = ThreadPoolExecutor(max_workers=Config.SEARCH_MAX_WORKERS)
         
         print("✅ Sistem hazır!")
     
-    def load_pdfs(self, pdf_files: List[str]):
-        """PDF dosyalarını yükler ve index oluşturur"""
-        print("\n" + Config.SEPARATOR_LINE)
-        print("📚 PDF YÜKLEME VE İNDEXLEME")
-        print(Config.SEPARATOR_LINE)
+    def update_collection(self, collection_name: str,
+                          files: List[Tuple[str, str, List[str], np.ndarray]]
+                          ) -> Tuple[DocumentCollection, List[str]]:
+        """İşlenen dosyaları koleksiyona uygulayıp güncel index'i atomik olarak devreye alır
         
-        try:
-            # PDF'leri işle
-            self.pdf_chunks = self.pdf_processor.process_pdf_files(pdf_files)
-            
-            # Embeddings oluştur
-            print("🧠 Embedding'ler oluşturuluyor...")
-            self.embeddings = self.embed_model.encode(
-                self.pdf_chunks, 
-                convert_to_numpy=True, 
-                show_progress_bar=True
-            )
-            
-            # FAISS index oluştur
-            print("🔍 Arama index'i oluşturuluyor...")
-            self.index = faiss.IndexFlatL2(self.embeddings.shape[1])
-            self.index.add(self.embeddings)
+        Koleksiyonda aynı parmak iziyle bulunan dosyalar writer lock altında tekrar
+        kontrol edilip atlanır. Yeni index sorguları bekletmeden kilit dışında
+        oluşturulur. Koleksiyon bellekte değilse (ör. iş sürerken unload edildiyse)
+        diskteki kopyası güncellenir ve koleksiyon belleğe geri yüklenmez.
+        """
+        with self._writer_lock(collection_name):
+            current = self._snapshot_collections().get(collection_name)
+            mounted = current is not None
+            if current is None and DocumentCollection.exists(collection_name):
+                current = DocumentCollection.load(collection_name)
+            if current is None:
+                current = DocumentCollection.empty(collection_name, files[0][3].shape[1])
+                mounted = True
             
-            print(f"✅ İndexleme tamamlandı!")
-            print(f"   📊 Toplam chunk sayısı: {len(self.pdf_chunks)}")
-            print(f"   🎯 Embedding boyutu: {self.embeddings.shape[1]}")
-            
-        except Exception as e:
-            print(f"❌ PDF yükleme hatası: {str(e)}")
-            raise
+            collection, applied = current.updated(files)
+            if applied:
+                collection.save()
+                if mounted:
+                    with self._collections_lock:
+                        self.collections[collection_name] = collection
+        
+        return collection, applied
+    
+    def _writer_lock(self, collection_name: str) -> threading.Lock:
+        """Koleksiyonun writer lock'unu döndürür"""
+        with self._collections_lock:
+            return self._writer_locks.setdefault(collection_name, threading.Lock())
+    
+    def _snapshot_collections(self) -> Dict[str, DocumentCollection]:
+        """Koleksiyonların o anki kopyasını döndürür"""
+        with self._collections_lock:
+            return dict(self.collections)
+    
+    def mount_collection(self, collection_name: str) -> DocumentCollection:
+        """Diskte kayıtlı koleksiyonu belleğe yükler"""
+        collection = self._snapshot_collections().get(collection_name)
+        if collection is not None:
+            return collection
+        
+        if not DocumentCollection.exists(collection_name):
+            raise ValueError(f"Koleksiyon bulunamadı: {collection_name}")
+        
+        # Diskteki kopya güncellenirken eski sürüm yüklenmesin
+        with self._writer_lock(collection_name):
+            collection = DocumentCollection.load(collection_name)
+            with self._collections_lock:
+                collection = self.collections.setdefault(collection_name, collection)
+        
+        print(f"📂 Koleksiyon diskten yüklendi: {collection_name} ({len(collection.chunks)} chunk)")
+        return collection
+    
+    def unload_collection(self, collection_name: str) -> bool:
+        """Koleksiyonu bellekten kaldırır; diskteki kopyası korunur"""
+        with self._writer_lock(collection_name):
+            with self._collections_lock:
+                removed = self.collections.pop(collection_name, None)
+        
+        if removed is None:
+            print(f"⚠️  Koleksiyon bellekte değil: {collection_name}")
+            return False
+        
+        print(f"🗑️  Koleksiyon bellekten kaldırıldı: {collection_name} (diskte saklanıyor)")
+        return True
+    
+    def delete_collection(self, collection_name: str) -> bool:
+        """Koleksiyonu bellekten ve diskten siler"""
+        with self._writer_lock(collection_name):
+            with self._collections_lock:
+                removed = self.collections.pop(collection_name, None) is not None
+            if DocumentCollection.exists(collection_name):
+                shutil.rmtree(DocumentCollection.storage_path(collection_name))
+                removed = True
+        
+        if removed:
+            print(f"🗑️  Koleksiyon silindi: {collection_name}")
+        return removed
+    
+    def list_collections(self) -> List[str]:
+        """Bellekteki koleksiyon isimlerini döndürür"""
+        return sorted(self._snapshot_collections().keys())
+    
+    def get_collection_sources(self, collection_name: str) -> Dict[str, str]:
+        """Koleksiyona daha önce eklenmiş PDF dosyalarını ve parmak izlerini döndürür"""
+        collection = self._snapshot_collections().get(collection_name)
+        if collection is not None:
+            return collection.sources
+        return DocumentCollection.load_sources(collection_name)
+    
+    def list_stored_collections(self) -> List[str]:
+        """Diskte kayıtlı koleksiyon isimlerini döndürür"""
+        return DocumentCollection.list_stored()
     
-    def ask_question(self, question: str, top_k: int = None) -> str:
-        """Soruya cevap verir"""
-        if not self.is_ready():
+    def ask_question(self, question: str, top_k: int = None, 
+                     collections: Optional[List[str]] = None) -> str:
+        """Soruya seçili koleksiyonlarda arama yaparak cevap verir"""
+        if collections is not None:
+            # Adı verilen koleksiyonlar bellekte değilse aramada diskten yüklenir
+            missing = [name for name in collections if not self.has_collection(name)]
+            if missing:
+                raise ValueError(f"Koleksiyon bulunamadı: {', '.join(missing)}")
+        elif not self.is_ready():
             raise ValueError("Sistem hazır değil! Önce PDF dosyalarını yükleyin.")
         
         if top_k is None:
@@ -94,8 +299,9 @@ class TurkishPDFQA:
             question_embedding = self.embed_model.encode([question], convert_to_numpy=True)
             
             # En yakın chunk'ları bul
-            D, I = self.index.search(question_embedding, top_k)
-            top_chunks = [self.pdf_chunks[i] for i in I[0]]
+            top_chunks = self._search_collections(question_embedding, top_k, collections)
+            if not top_chunks:
+                raise ValueError("Seçili koleksiyonlarda ilgili chunk bulunamadı!")
             
             # Her chunk için cevap üret
             chunk_answers = []
@@ -112,6 +318,34 @@ class TurkishPDFQA:
             print(f"❌ Soru cevaplama hatası: {str(e)}")
             raise
     
+    def _search_collections(self, question_embedding: np.ndarray, top_k: int,
+                            collections: Optional[List[str]] = None) -> List[str]:
+        """Seçili koleksiyonlarda paralel arama yapar ve sonuçları mesafeye göre birleştirir"""
+        available = self._snapshot_collections()
+        if collections is None:
+            targets = list(available.values())
+        else:
+            # Aynı koleksiyon iki kez aranmasın
+            collections = list(dict.fromkeys(collections))
+            
+            # Bellekte olmayan koleksiyonlar diskten yüklenir
+            for name in collections:
+                if name not in available:
+                    available[name] = self.mount_collection(name)
+            targets = [available[name] for name in collections]
+        
+        if len(targets) == 1:
+            results = [targets[0].search(question_embedding, top_k)]
+        else:
+            # FAISS arama sırasında GIL'i bıraktığı için thread'ler paralel çalışır
+            results = list(self._search_executor.map(
+                lambda collection: collection.search(question_embedding, top_k),
+                targets
+            ))
+        
+        merged = sorted((hit for hits in results for hit in hits), key=lambda hit: hit[0])
+        return [chunk for _, chunk in merged[:top_k]]
+    
     def _generate_answer_for_chunk(self, chunk: str, question: str) -> str:
         """Tek chunk için cevap üretir"""
         prompt = f"""Metin: {chunk}\n\nSoru: {question}\n\nCevap:"""
@@ -176,22 +410,32 @@ CEVAP:"""
         final_answer = self.tokenizer.decode(final_output[0], skip_special_tokens=True)
         return final_answer.split("CEVAP:")[-1].strip()
     
+    def has_collection(self, collection_name: str) -> bool:
+        """Koleksiyonun bellekte veya diskte bulunup bulunmadığını kontrol eder"""
+        return (collection_name in self._snapshot_collections() or 
+                DocumentCollection.exists(collection_name))
+    
+    def can_search(self, collections: Optional[List[str]] = None) -> bool:
+        """Verilen koleksiyonlarda (varsayılan: bellektekilerin tümü) arama yapılabilir mi"""
+        if collections is None:
+            return self.is_ready()
+        return all(self.has_collection(name) for name in collections)
+    
     def is_ready(self) -> bool:
         """Sistemin hazır olup olmadığını kontrol eder"""
-        return (self.pdf_chunks is not None and 
-                len(self.pdf_chunks) > 0 and 
-                self.embeddings is not None and 
-                self.index is not None)
+        return any(len(c.chunks) > 0 for c in self._snapshot_collections().values())
     
     def get_stats(self) -> dict:
         """Sistem istatistiklerini döndürür"""
-        if not self.is_ready():
+        collections = [c for c in self._snapshot_collections().values() if len(c.chunks) > 0]
+        if not collections:
             return {"status": "not_ready"}
         
         return {
             "status": "ready",
-            "chunk_count": len(self.pdf_chunks),
-            "embedding_dim": self.embeddings.shape[1],
+            "collections": {c.name: len(c.chunks) for c in collections},
+            "chunk_count": sum(len(c.chunks) for c in collections),
+            "embedding_dim": collections[0].embedding_dim,
             "device": str(self.device),
             "model_name": Config.LLM_MODEL_NAME
         } 
\ No newline at end of file
@@ -4,6 +4,7 @@ Türkçe PDF QA Sistemi Yardımcı Fonksiyonları
 import os
 import re
 import glob
+import hashlib
 from pathlib import Path
 from typing import List, Optional
 from config import Config
@@ -33,6 +34,14 @@ def validate_pdf_file(file_path: str) -> bool:
     
     return True
 
+def file_fingerprint(file_path: str) -> str:
+    """Dosya içeriğinin SHA-1 parmak izini döndürür"""
+    sha1 = hashlib.sha1()
+    with open(file_path, 'rb') as file:
+        for block in iter(lambda: file.read(1024 * 1024), b''):
+            sha1.update(block)
+    return sha1.hexdigest()
+
 def find_pdf_files(directory: str) -> List[str]:
     """Dizindeki tüm PDF dosyalarını bulur"""
     pdf_files = []